@@ -5,6 +5,8 @@ Entry point for running the package as a module.
 Author: David Diaz (https://github.com/alfdav)
 Version: 1.0.0
 """
+from __future__ import annotations
+
 from curlthis.main import main
 
 if __name__ == "__main__":
@@ -4,12 +4,56 @@ Formatter module for curl commands.
 Author: David Diaz (https://github.com/alfdav)
 Version: 1.0.0
 """
-from typing import Dict, Any
-import shlex
+from __future__ import annotations
+
+from typing import Any
+import functools
+import string
+import sys
 import json
 
+# orjson validates JSON with a SIMD-accelerated parser; fall back to the
+# stdlib when the optional dependency is absent
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from curlthis.types import ParsedRequest
+
+# Characters that never need shell quoting. Mirrors shlex.quote's safe set,
+# restricted to ASCII so membership checks stay on the C fast path.
+_SAFE = frozenset(string.ascii_letters + string.digits + "@%+=:,./-_")
+
+# Headers emitted through dedicated curl flags rather than -H; members are
+# interned so lookups against interned parser output compare by identity
+_SKIP_HEADERS = frozenset({sys.intern('host'), sys.intern('cookie')})
+
+# Bodies starting with one of these look like a raw HTTP request rather than
+# payload data. str.startswith checks the whole tuple in a single C call.
+_HTTP_PREFIXES = ('GET ', 'POST ', 'PUT ', 'DELETE ', 'PATCH ', 'HEAD ',
+                  'OPTIONS ', 'TRACE ', 'CONNECT ', 'HTTP/')
+
+
+def _shquote(s: str) -> str:
+    """Shell-quote a string, skipping allocation when it is already safe.
+
+    Behaves like shlex.quote but avoids the per-call regex search: a single
+    C-level set-membership scan decides whether quoting is needed at all.
 
-def kadabra_format_curl(request_data: Dict[str, Any]) -> str:
+    Args:
+        s: The string to quote
+
+    Returns:
+        The string, quoted for POSIX shells if necessary
+    """
+    if s and all(c in _SAFE for c in s):
+        return s
+    return "'" + s.replace("'", "'\"'\"'") + "'"
+
+
+def kadabra_format_curl(request_data: "dict[str, Any] | ParsedRequest") -> str:
     """
     Format parsed request data as a curl command.
     
@@ -17,9 +61,10 @@ def kadabra_format_curl(request_data: Dict[str, Any]) -> str:
     curl command string that works across all platforms (Unix/Linux, macOS, Windows).
     
     Args:
-        request_data: Dictionary containing parsed request components.
-                     Required keys: method, url, headers
-                     Optional keys: body, cookies, proxy, cookie_jar
+        request_data: Parsed request components, either as a ParsedRequest
+                     (preferred: attribute access beats dict lookups) or a
+                     dictionary with required keys method, url, headers and
+                     optional keys body, cookies, proxy, cookie_jar.
         
     Returns:
         A cross-platform compatible curl command string
@@ -27,68 +72,98 @@ def kadabra_format_curl(request_data: Dict[str, Any]) -> str:
     Raises:
         ValueError: If required fields are missing or invalid
     """
-    # Validate required fields
+    # Validate required fields (kept outside the cache so bad inputs are
+    # never memoized)
+    if isinstance(request_data, ParsedRequest):
+        if not request_data.url:
+            raise ValueError(
+                "Missing URL in request data. Cannot generate curl command without a URL."
+            )
+        return _format_curl_cached(
+            request_data.method,
+            request_data.url,
+            tuple(request_data.headers.items()),
+            request_data.body,
+            request_data.cookies,
+            request_data.proxy,
+            request_data.cookie_jar,
+        )
+
     if not request_data.get('url'):
         raise ValueError(
             "Missing URL in request data. Cannot generate curl command without a URL."
         )
-    
-    method = request_data.get('method', 'GET')
-    url = request_data.get('url', '')
-    headers = request_data.get('headers', {})
-    body = request_data.get('body')
-    cookies = request_data.get('cookies')
-    proxy = request_data.get('proxy')
-    cookie_jar = request_data.get('cookie_jar')
-    
-    # Start building the curl command
-    curl_parts = [f"curl -X {method}"]
-    
-    # Properly escape the URL for all platforms
-    escaped_url = shlex.quote(url)
-    curl_parts.append(escaped_url)
-    
+
+    return _format_curl_cached(
+        request_data.get('method', 'GET'),
+        request_data.get('url', ''),
+        tuple(request_data.get('headers', {}).items()),
+        request_data.get('body'),
+        request_data.get('cookies'),
+        request_data.get('proxy'),
+        request_data.get('cookie_jar'),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _format_curl_cached(method: str, url: str, headers: tuple,
+                        body: str | None, cookies: str | None,
+                        proxy: str | None, cookie_jar: str | None) -> str:
+    """Build the curl command for an immutable request signature.
+
+    The formatter is pure over its inputs, so identical requests (common when
+    replaying captures or running test fixtures) hit the LRU cache instead of
+    rebuilding the command string.
+    """
+    # Start building the curl command; flags and values are kept as separate
+    # list elements so no per-part formatted string is allocated before the
+    # single join at the end.
+    curl_parts = ["curl", "-X", method, _shquote(url)]
+
     # Add proxy if specified
     if proxy:
-        escaped_proxy = shlex.quote(proxy)
-        curl_parts.append(f"--proxy {escaped_proxy}")
-    
+        curl_parts.extend(("--proxy", _shquote(proxy)))
+
     # Add headers with proper escaping
-    for header, value in headers.items():
-        # Skip headers that are handled separately
-        if header.lower() in ('host', 'cookie'):
-            continue
-        # Escape the header value to handle special characters
-        header_arg = f"{header}: {value}"
-        escaped_header = shlex.quote(header_arg)
-        curl_parts.append(f"-H {escaped_header}")
-    
+    if headers:
+        for header, value in headers:
+            # Skip headers that are handled separately; only pay for the
+            # lowercased copy when the name isn't already lowercase
+            key = header if header.islower() else header.lower()
+            if key in _SKIP_HEADERS:
+                continue
+            # Escape the header value to handle special characters
+            curl_parts.extend(("-H", _shquote(f"{header}: {value}")))
+
     # Add cookies if present
     if cookies:
-        escaped_cookies = shlex.quote(cookies)
-        curl_parts.append(f"--cookie {escaped_cookies}")
-    
+        curl_parts.extend(("--cookie", _shquote(cookies)))
+
     # Add cookie jar if specified
     if cookie_jar:
-        escaped_jar = shlex.quote(cookie_jar)
-        curl_parts.append(f"--cookie-jar {escaped_jar}")
+        curl_parts.extend(("--cookie-jar", _shquote(cookie_jar)))
     
     # Add body if present with proper escaping
-    if body and body.strip():
+    if body:
+        stripped = body.strip()
         # Check if the body looks like a raw HTTP request (starts with HTTP method or version)
-        # Updated to include PATCH and OPTIONS
-        http_prefixes = ['GET ', 'POST ', 'PUT ', 'DELETE ', 'PATCH ', 'HEAD ', 'OPTIONS ', 'TRACE ', 'CONNECT ', 'HTTP/']
-        if not any(body.strip().startswith(prefix) for prefix in http_prefixes):
-            # Try to detect if it's JSON
-            try:
-                json.loads(body)
+        if stripped and not stripped.startswith(_HTTP_PREFIXES):
+            # Cheap probe: top-level JSON must start with one of these, so
+            # non-JSON bodies skip the full parse and exception unwinding.
+            is_json = stripped[0] in '{["-tfn' or stripped[0].isdigit()
+            if is_json:
+                try:
+                    _json_loads(stripped)
+                except (ValueError, TypeError):
+                    # orjson's JSONDecodeError subclasses ValueError, as does
+                    # the stdlib's
+                    is_json = False
+            if is_json:
                 # It's valid JSON, use -d with proper escaping
-                escaped_body = shlex.quote(body)
-                curl_parts.append(f"-d {escaped_body}")
-            except (json.JSONDecodeError, TypeError):
+                curl_parts.extend(("-d", _shquote(body)))
+            else:
                 # Not JSON or invalid JSON, use --data-raw with proper escaping
-                escaped_body = shlex.quote(body)
-                curl_parts.append(f"--data-raw {escaped_body}")
+                curl_parts.extend(("--data-raw", _shquote(body)))
     
     # Join all parts with spaces to create a true one-liner
     return ' '.join(curl_parts)
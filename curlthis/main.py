@@ -5,33 +5,42 @@ Main module for curlthis CLI application.
 Author: David Diaz (https://github.com/alfdav)
 Version: 1.0.0
 """
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+
+from typing import Optional
+import re
 import sys
 import os
 import typer
-import pyperclip
 from pathlib import Path
 
-from rich.markdown import Markdown
-from rich.progress import BarColumn, TaskProgressColumn
-from rich.traceback import install as install_rich_traceback
-
-from curlthis.parser import alakazam_parse_request
-from curlthis.formatter import kadabra_format_curl
 from curlthis.utils import (
     console, error_console, STATUS,
     hitmonchan_show_banner, primeape_show_error, primeape_show_warning,
     hitmonchan_show_success, hitmonchan_show_progress, create_table,
-    create_section, kadabra_display_code, meowth_copy_to_clipboard
+    create_section, kadabra_display_code, meowth_copy_to_clipboard,
+    meowth_paste_from_clipboard
 )
 
-# Install Rich traceback handler
-install_rich_traceback(show_locals=True, width=120, word_wrap=True)
+# Environment variables whose presence indicates an SSH session; the
+# environment is fixed for the life of the process, so probe it once
+_SSH_KEYS = frozenset({'SSH_CLIENT', 'SSH_TTY', 'SSH_CONNECTION'})
+_IS_SSH_ENV = not os.environ.keys().isdisjoint(_SSH_KEYS)
+
+# Quick pre-screen for input that cannot be an HTTP request: a request line
+# must start with a known method. Compiled once; scanned over the first 512
+# characters only, so obviously bad input fails before the full parser runs.
+# Case-insensitive because the parser uppercases the method before
+# validating — the gate must accept everything the parser accepts.
+_METHOD_RE = re.compile(
+    r"^\s*(?:GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS|TRACE|CONNECT)\s",
+    re.MULTILINE | re.IGNORECASE,
+)
 
 # Create Typer app with rich formatting
 app = typer.Typer(
     help="Transform raw HTTP requests with headers into curl one-liners",
-    add_completion=True,
+    add_completion=False,
     rich_markup_mode="rich",
     context_settings={"help_option_names": ["--help", "-h"]}
 )
@@ -63,7 +72,8 @@ def machamp_process_request(
     disable_clipboard: bool = typer.Option(False, "--disable-clipboard", "--ssh", help="Force SSH mode: disable clipboard and use plain text display (useful for SSH sessions)"),
     proxy: Optional[str] = typer.Option(None, "--proxy", "-p", help="Proxy server (e.g., http://proxy.example.com:8080)"),
     cookie_jar: Optional[Path] = typer.Option(None, "--cookie-jar", "-j", help="Cookie jar file path for saving/loading cookies"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose output")
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose output"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress the banner and decorative output")
 ) -> None:
     """
     Transform raw HTTP requests with headers into curl one-liners.
@@ -83,115 +93,178 @@ def machamp_process_request(
         $ curlthis -f request.txt --proxy http://proxy.example.com:8080  # Use proxy
         $ curlthis -f request.txt --cookie-jar cookies.txt  # Save cookies to file
     """
-    hitmonchan_show_banner(author="David Diaz (https://github.com/alfdav)")
-    # Add a blank line for better visual separation
-    console.print("")
+    # Parser and formatter are only needed once real input arrives; deferring
+    # the imports keeps --help and error paths off their import cost
+    from curlthis.parser import alakazam_parse_request
+    from curlthis.formatter import kadabra_format_curl
+
+    # Resolve the clipboard decision once up front: when any disable flag is
+    # set, the copy section (and its potential fork/exec) is skipped entirely
+    should_copy = clipboard and not (no_clipboard or disable_clipboard)
+
+    # Banner rendering is pure decoration: skip it when output is piped
+    # (cat req | curlthis | xclip) or explicitly silenced
+    decorate = sys.stdout.isatty() and not quiet and not os.environ.get("CURLTHIS_QUIET")
+    if decorate:
+        hitmonchan_show_banner(author="David Diaz (https://github.com/alfdav)")
+        # Add a blank line for better visual separation
+        console.line()
     
-    # Get input from file, clipboard, or stdin
+    # Get input from file, clipboard, or stdin. Only the I/O is guarded:
+    # a blanket handler around the whole body used to swallow typer.Exit
+    # and re-report it as an unexpected error.
     raw_request = ""
     
+    # One isatty syscall, decided up front
+    stdin_is_pipe = file is None and not sys.stdin.isatty()
+    
     try:
         if file:
-            raw_request = file.read_text()
+            # Binary read + one decode skips text-mode newline translation;
+            # CRLF normalization is done explicitly so it stays controlled
+            raw_request = file.read_bytes().decode('utf-8', errors='replace')
+            if '\r\n' in raw_request:
+                raw_request = raw_request.replace('\r\n', '\n')
             if verbose:
                 hitmonchan_show_progress(f"Reading from file: {file}")
-        elif not sys.stdin.isatty():
-            raw_request = sys.stdin.read()
+        elif stdin_is_pipe:
+            # Drain stdin with large os.read chunks (one syscall per 64 KiB
+            # instead of text-mode 8 KiB chunking) and decode once at the
+            # end. Streams without a real fd (e.g. test harnesses) fall back
+            # to the buffered reader.
+            try:
+                fd = sys.stdin.fileno()
+            except (OSError, ValueError):
+                fd = None
+            if fd is not None:
+                buf = bytearray()
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    buf += chunk
+                raw_request = bytes(buf).decode('utf-8', errors='replace')
+            else:
+                raw_request = sys.stdin.buffer.read().decode('utf-8', errors='replace')
+            if '\r\n' in raw_request:
+                raw_request = raw_request.replace('\r\n', '\n')
             if verbose:
                 hitmonchan_show_progress("Reading from stdin")
         else:
-            # Try to get from clipboard
-            try:
-                raw_request = pyperclip.paste()
-                if verbose:
-                    hitmonchan_show_progress("Reading from clipboard")
-            except Exception as e:
-                primeape_show_error("Failed to read from clipboard", e)
+            # Try to get from clipboard via the pre-resolved backend
+            clipboard_text = meowth_paste_from_clipboard()
+            if clipboard_text is None:
+                primeape_show_error("Failed to read from clipboard")
                 raise typer.Exit(code=1)
+            raw_request = clipboard_text
+            if verbose:
+                hitmonchan_show_progress("Reading from clipboard")
+    except OSError as e:
+        primeape_show_error("Failed to read input", e)
+        raise typer.Exit(code=1)
     
-        if not raw_request.strip():
-            primeape_show_error("No input provided")
-            raise typer.Exit(code=1)
-            
-        # Parse the raw request
-        if verbose:
-            hitmonchan_show_progress("Parsing raw request...", spinner=True)
+    # isspace() short-circuits on the first non-whitespace byte without
+    # materializing a stripped copy of a potentially multi-MB capture
+    if not raw_request or raw_request.isspace():
+        primeape_show_error("No input provided")
+        raise typer.Exit(code=1)
+    
+    if not _METHOD_RE.search(raw_request[:512]):
+        primeape_show_error(
+            "Input does not look like an HTTP request. "
+            "Expected a request line such as 'GET /path HTTP/1.1'."
+        )
+        raise typer.Exit(code=1)
         
+    # Parse the raw request
+    if verbose:
+        hitmonchan_show_progress("Parsing raw request...", spinner=True)
+    
+    try:
         request_data = alakazam_parse_request(raw_request)
-        
-        # Add CLI-provided options to request data
-        if proxy:
-            request_data['proxy'] = proxy
-            if verbose:
-                hitmonchan_show_progress(f"Using proxy: {proxy}")
-        
-        if cookie_jar:
-            request_data['cookie_jar'] = str(cookie_jar)
-            if verbose:
-                hitmonchan_show_progress(f"Using cookie jar: {cookie_jar}")
-        
-        # Format as curl command
+    except ValueError as e:
+        primeape_show_error("Failed to parse request", e)
+        raise typer.Exit(code=1)
+    
+    # Add CLI-provided options to request data
+    if proxy:
+        request_data['proxy'] = proxy
         if verbose:
-            hitmonchan_show_progress("Formatting as curl command...", spinner=True)
-            
-        curl_command = kadabra_format_curl(request_data)
+            hitmonchan_show_progress(f"Using proxy: {proxy}")
+    
+    if cookie_jar:
+        request_data['cookie_jar'] = str(cookie_jar)
+        if verbose:
+            hitmonchan_show_progress(f"Using cookie jar: {cookie_jar}")
+    
+    # Format as curl command
+    if verbose:
+        hitmonchan_show_progress("Formatting as curl command...", spinner=True)
         
-        # Check for SSH session or if --ssh flag was used
-        is_ssh_session = False
-        try:
-            # Check common SSH environment variables
-            is_ssh_session = bool(os.environ.get('SSH_CLIENT') or os.environ.get('SSH_TTY') or 
-                                os.environ.get('SSH_CONNECTION'))
-            
-            # Also treat as SSH session if --ssh or --disable-clipboard flag was used
-            is_ssh_session = is_ssh_session or disable_clipboard
-        except Exception:
-            pass
-            
+    try:
+        curl_command = kadabra_format_curl(request_data)
+    except ValueError as e:
+        primeape_show_error("Failed to format curl command", e)
+        raise typer.Exit(code=1)
+    
+    # Check for SSH session or if --ssh flag was used
+    is_ssh_session = _IS_SSH_ENV or disable_clipboard
+    
+    if not sys.stdout.isatty():
+        # Piped output: emit the bare command and skip the Rich/Pygments
+        # rendering entirely so consumers never see ANSI escapes
+        sys.stdout.write(curl_command + "\n")
+        sys.stdout.flush()
+    else:
         # Always display the syntax-highlighted version first
         kadabra_display_code(curl_command, language="bash", title="Generated curl command", line_numbers=True)
         
         # Add a blank line for better visual separation
-        console.print("")
-        
-        # For SSH sessions or when --ssh flag is used, also display a plain text version for easy copying
-        if is_ssh_session:
-            # First show a header with clear instructions
-            console.print("[bold yellow]Copy-Paste Command:[/bold yellow]")
-            console.print("[dim]The command below is formatted for easy selection in SSH environments:[/dim]")
-            
-            # Add a blank line before the command for easier selection
-            console.print("")
-            
-            # Print the command as plain text with no styling or formatting
-            # This makes it extremely easy to select with triple-click or drag selection
-            console.print(curl_command, highlight=False, markup=False, emoji=False, overflow="fold")
-            
-            # Add a blank line after the command
-            console.print("")
-            
-            # Add a separator for visual clarity
-            console.print("[dim]---[/dim]")
-        
-        # Copy to clipboard by default unless explicitly disabled
-        # Important: Copy the raw command without line numbers to make it directly usable
-        should_copy = clipboard and not no_clipboard and not disable_clipboard
-        if should_copy:
-            # Use the cross-platform clipboard function for better error handling
-            success, message = meowth_copy_to_clipboard(curl_command)
-            if success:
-                hitmonchan_show_success(message)
-            else:
-                # Show a warning with helpful instructions instead of an error
-                # Use multiline=True to preserve formatting in the installation instructions
-                primeape_show_warning(message, title="Clipboard Issue", multiline=True)
-                
-    except Exception as e:
-        primeape_show_error("An unexpected error occurred", e)
-        raise typer.Exit(code=1)
+        if decorate:
+            console.line()
+    
+    # For SSH sessions or when --ssh flag is used, also display a plain text version for easy copying
+    if is_ssh_session and sys.stdout.isatty():
+        from rich.text import Text
+
+        # Header and hints in one render pass; the command itself bypasses
+        # Rich entirely because cell-width measurement walks every codepoint
+        # of what can be a very long line (the terminal wraps it natively)
+        console.print(Text.from_markup(
+            "[bold yellow]Copy-Paste Command:[/bold yellow]\n"
+            "[dim]The command below is formatted for easy selection in SSH environments:[/dim]\n"
+        ))
+        console.file.write(curl_command + "\n")
+        console.print(Text.from_markup("\n[dim]---[/dim]"))
+    
+    # Copy to clipboard by default unless explicitly disabled
+    # Important: Copy the raw command without line numbers to make it directly usable
+    if should_copy:
+        # Use the cross-platform clipboard function for better error handling
+        success, message = meowth_copy_to_clipboard(curl_command)
+        if not sys.stdout.isatty():
+            # Piped stdout carries only the bare command; clipboard status
+            # goes to stderr so `curlthis | sh` and redirects stay clean
+            sys.stderr.write(f"[{'OK' if success else '!'}] {message}\n")
+        elif success:
+            hitmonchan_show_success(message)
+        else:
+            # Show a warning with helpful instructions instead of an error
+            # Use multiline=True to preserve formatting in the installation instructions
+            primeape_show_warning(message, title="Clipboard Issue", multiline=True)
 
 def main() -> None:
     """Entry point for the application."""
+    # Install the Rich traceback handler here rather than at import so
+    # library imports and test collection never pay for it. Interactive
+    # stderr only, opt-out via CURLTHIS_RICH_TB=0, and without show_locals:
+    # serializing every frame's locals on a crash is a latency and memory
+    # hazard. The sys sentinel keeps the hook from being installed twice.
+    if (sys.stderr.isatty() and os.environ.get("CURLTHIS_RICH_TB", "1") != "0"
+            and not getattr(sys, "_curlthis_rich_tb", False)):
+        from rich.traceback import install as install_rich_traceback
+        install_rich_traceback(show_locals=False, width=120, word_wrap=True)
+        sys._curlthis_rich_tb = True
     try:
         app(prog_name="curlthis")
     except Exception as e:
@@ -0,0 +1,34 @@
+"""
+Shared data types for curlthis.
+
+Author: David Diaz (https://github.com/alfdav)
+Version: 1.0.0
+"""
+from typing import Dict, Optional
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ParsedRequest:
+    """Immutable parsed HTTP request.
+
+    Attribute access on a dataclass instance is cheaper than the repeated
+    dict.get lookups the formatter otherwise performs, and the frozen class
+    surfaces field typos at the call site.
+
+    Attributes:
+        method: The HTTP method (GET, POST, ...)
+        url: The full request URL
+        headers: Request headers as a name -> value mapping
+        body: Optional request body
+        cookies: Optional Cookie header value
+        proxy: Optional proxy server
+        cookie_jar: Optional cookie jar file path
+    """
+    method: str = 'GET'
+    url: str = ''
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[str] = None
+    cookies: Optional[str] = None
+    proxy: Optional[str] = None
+    cookie_jar: Optional[str] = None
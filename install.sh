@@ -78,29 +78,36 @@ machoke_setup_venv() {
     print_status "Machoke uses Strength to set up virtual environment..."
     
     VENV_DIR="$HOME/.curlthis_venv"
-    
-    # Create virtual environment if it doesn't exist
-    if [ ! -d "$VENV_DIR" ]; then
+    VENV_EXISTED=0
+
+    # Create virtual environment only when a valid one is not already there;
+    # pyvenv.cfg is the marker python3 -m venv writes, so its presence means
+    # the multi-second venv bootstrap can be skipped on re-runs
+    if [ -f "$VENV_DIR/pyvenv.cfg" ]; then
+        print_info "Using existing virtual environment at $VENV_DIR..."
+        VENV_EXISTED=1
+    else
         print_info "Creating virtual environment at $VENV_DIR..."
         python3 -m venv "$VENV_DIR"
         if [ $? -ne 0 ]; then
             print_error "Failed to create virtual environment."
             exit 1
         fi
-    else
-        print_info "Using existing virtual environment at $VENV_DIR..."
     fi
-    
+
     # Activate virtual environment
     source "$VENV_DIR/bin/activate"
     if [ $? -ne 0 ]; then
         print_error "Failed to activate virtual environment."
         exit 1
     fi
-    
-    # Install the package in development mode
+
+    # Install the package in development mode; only bootstrap pip on a fresh
+    # venv — upgrading it on every re-run costs seconds for no benefit
     print_info "Installing curlthis..."
-    pip install --upgrade pip
+    if [ $VENV_EXISTED -eq 0 ]; then
+        pip install --upgrade pip
+    fi
     pip install -e .
     if [ $? -ne 0 ]; then
         print_error "Failed to install curlthis package."
@@ -5,48 +5,96 @@ import sys
 # Add the project root to the path so we can import the package
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-@pytest.fixture
-def basic_get_request():
-    return """GET /api/v1/users HTTP/1.1
+# Fix the terminal environment before anything imports Rich so every CLI
+# invocation skips color-system and width probing instead of re-detecting
+# them per test
+os.environ["NO_COLOR"] = "1"
+os.environ["TERM"] = "dumb"
+# A fixed width keeps Rich from querying the terminal size on every Console
+# construction and makes rendered output deterministic across environments
+os.environ["COLUMNS"] = "120"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_parser():
+    """Import the parser once up front.
+
+    Its import-time work (building the method/header tables, interning) is
+    paid here instead of inside whichever test happens to run first.
+    """
+    import curlthis.parser  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def cli_app():
+    """The Typer app, imported once per session."""
+    from curlthis.main import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """A single CliRunner shared across the whole session."""
+    from typer.testing import CliRunner
+    return CliRunner()
+
+# Raw request bodies as module constants: the strings are immutable, so the
+# session-scoped fixtures below hand out the same object instead of
+# re-evaluating a triple-quoted literal per test
+_BASIC_GET = """GET /api/v1/users HTTP/1.1
 Host: example.com
 Accept: application/json
 """
 
-@pytest.fixture
-def post_json_request():
-    return """POST /api/v1/users HTTP/1.1
+_POST_JSON = """POST /api/v1/users HTTP/1.1
 Host: example.com
 Content-Type: application/json
 
 {"name": "John", "email": "john@example.com"}
 """
 
-@pytest.fixture
-def patch_request():
-    return """PATCH /api/v1/users/123 HTTP/1.1
+_PATCH = """PATCH /api/v1/users/123 HTTP/1.1
 Host: example.com
 Content-Type: application/json
 
 {"name": "John Updated"}
 """
 
-@pytest.fixture
-def options_request():
-    return """OPTIONS /api/v1/users HTTP/1.1
+_OPTIONS = """OPTIONS /api/v1/users HTTP/1.1
 Host: example.com
 """
 
-@pytest.fixture
-def request_with_cookies():
-    return """GET /dashboard HTTP/1.1
+_WITH_COOKIES = """GET /dashboard HTTP/1.1
 Host: example.com
 Cookie: session_id=12345; theme=dark
 """
 
-@pytest.fixture
-def request_with_proxy_headers():
-    return """GET / HTTP/1.1
+_WITH_PROXY_HEADERS = """GET / HTTP/1.1
 Host: example.com
 X-Forwarded-For: 10.0.0.1
 Proxy-Connection: keep-alive
 """
+
+@pytest.fixture(scope="session")
+def basic_get_request():
+    return _BASIC_GET
+
+@pytest.fixture(scope="session")
+def post_json_request():
+    return _POST_JSON
+
+@pytest.fixture(scope="session")
+def patch_request():
+    return _PATCH
+
+@pytest.fixture(scope="session")
+def options_request():
+    return _OPTIONS
+
+@pytest.fixture(scope="session")
+def request_with_cookies():
+    return _WITH_COOKIES
+
+@pytest.fixture(scope="session")
+def request_with_proxy_headers():
+    return _WITH_PROXY_HEADERS
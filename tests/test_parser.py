@@ -1,35 +1,29 @@
 import pytest
 from curlthis.parser import alakazam_parse_request
 
-def test_parse_basic_get(basic_get_request):
-    result = alakazam_parse_request(basic_get_request)
+def _check_basic_get(result):
     assert result['method'] == 'GET'
     assert result['url'] == 'https://example.com/api/v1/users'
     assert result['headers']['Accept'] == 'application/json'
     assert result['body'] is None
 
-def test_parse_post_json(post_json_request):
-    result = alakazam_parse_request(post_json_request)
+def _check_post_json(result):
     assert result['method'] == 'POST'
     assert result['body'] == '{"name": "John", "email": "john@example.com"}'
     assert result['headers']['Content-Type'] == 'application/json'
 
-def test_parse_patch(patch_request):
-    result = alakazam_parse_request(patch_request)
+def _check_patch(result):
     assert result['method'] == 'PATCH'
     assert 'John Updated' in result['body']
 
-def test_parse_options(options_request):
-    result = alakazam_parse_request(options_request)
+def _check_options(result):
     assert result['method'] == 'OPTIONS'
     assert result['body'] is None
 
-def test_parse_cookies(request_with_cookies):
-    result = alakazam_parse_request(request_with_cookies)
+def _check_cookies(result):
     assert result['cookies'] == 'session_id=12345; theme=dark'
 
-def test_parse_proxy(request_with_proxy_headers):
-    result = alakazam_parse_request(request_with_proxy_headers)
+def _check_proxy(result):
     assert 'proxy' in result
     # We capture one of them, depending on iteration order but we look for both
     # The implementation captures the last one found in the loop usually or first?
@@ -37,6 +31,20 @@ def test_parse_proxy(request_with_proxy_headers):
     # We just want to ensure it detected something.
     assert result['proxy'] is not None
 
+# One parametrized test instead of six near-identical ones, so fixture setup
+# and test collection overhead are paid per case rather than per function
+@pytest.mark.parametrize("fixture_name,check", [
+    ("basic_get_request", _check_basic_get),
+    ("post_json_request", _check_post_json),
+    ("patch_request", _check_patch),
+    ("options_request", _check_options),
+    ("request_with_cookies", _check_cookies),
+    ("request_with_proxy_headers", _check_proxy),
+])
+def test_parse_fixture(request, fixture_name, check):
+    raw = request.getfixturevalue(fixture_name)
+    check(alakazam_parse_request(raw))
+
 def test_missing_host():
     req = "GET / HTTP/1.1\nAccept: */*"
     with pytest.raises(ValueError, match="Missing Host header"):